@@ -13,7 +13,7 @@ from vizro_ai.dashboard._graph.dashboard_creation import _create_and_compile_gra
 from vizro_ai.dashboard._pydantic_output import _get_pydantic_model  # TODO: make general, ie remove from dashboard
 from vizro_ai.dashboard.utils import DashboardOutputs, _extract_overall_imports_and_code, _register_data
 from vizro_ai.plot._response_models import ChartPlan, ChartPlanFactory
-from vizro_ai.utils.helper import _get_df_info
+from vizro_ai.utils.helper import _get_df_info, _run_coroutine
 
 logger = logging.getLogger(__name__)
 
@@ -116,18 +116,20 @@ class VizroAI:
         runnable = _create_and_compile_graph()
 
         config = {"configurable": {"model": self.model}}
-        message_res = runnable.invoke(
-            {
-                "dfs": dfs,
-                "all_df_metadata": {},
-                "dashboard_plan": None,
-                "pages": [],
-                "dashboard": None,
-                "messages": [HumanMessage(content=user_input)],
-                "custom_charts_code": [],
-                "custom_charts_imports": [],
-            },
-            config=config,
+        message_res = _run_coroutine(
+            runnable.ainvoke(
+                {
+                    "dfs": dfs,
+                    "all_df_metadata": {},
+                    "dashboard_plan": None,
+                    "pages": [],
+                    "dashboard": None,
+                    "messages": [HumanMessage(content=user_input)],
+                    "custom_charts_code": [],
+                    "custom_charts_imports": [],
+                },
+                config=config,
+            )
         )
         dashboard = message_res["dashboard"]
         _register_data(all_df_metadata=message_res["all_df_metadata"])
@@ -1,7 +1,9 @@
 """Code generation graph for dashboard generation."""
 
+import asyncio
 import logging
 import operator
+from functools import lru_cache
 from typing import Annotated, Dict, List, Optional
 
 import pandas as pd
@@ -12,9 +14,9 @@ from langgraph.constants import END, Send
 from langgraph.graph import StateGraph
 from tqdm.auto import tqdm
 
-from vizro_ai.dashboard._pydantic_output import _get_pydantic_model
+from vizro_ai.dashboard._pydantic_output import _aget_pydantic_model
 from vizro_ai.dashboard._response_models.dashboard import DashboardPlan
-from vizro_ai.dashboard._response_models.df_info import DfInfo, _create_df_info_content, _get_df_info
+from vizro_ai.dashboard._response_models.df_info import DfInfo, _clean_df_name, _create_df_info_content, _get_df_info
 from vizro_ai.dashboard._response_models.page import PagePlan
 from vizro_ai.dashboard.utils import AllDfMetadata, DfMetadata, _execute_step
 from vizro_ai.utils.helper import DebugFailure
@@ -61,34 +63,46 @@ class GraphState(BaseModel):
         arbitrary_types_allowed = True
 
 
-def _store_df_info(state: GraphState, config: RunnableConfig) -> Dict[str, AllDfMetadata]:
+async def _store_df_info(state: GraphState, config: RunnableConfig) -> Dict[str, AllDfMetadata]:
     """Store information about the dataframes."""
     dfs = state.dfs
     all_df_metadata = state.all_df_metadata
     query = state.messages[0].content
-    current_df_names = []
-    with tqdm(total=len(dfs), desc="Store df info") as pbar:
-        for df in dfs:
-            df_schema, df_sample = _get_df_info(df)
-            df_info = _create_df_info_content(
-                df_schema=df_schema, df_sample=df_sample, current_df_names=current_df_names
-            )
+    llm = config["configurable"].get("model", None)
 
-            llm = config["configurable"].get("model", None)
-            try:
-                df_name = _get_pydantic_model(
-                    query=query,
-                    llm_model=llm,
-                    response_model=DfInfo,
-                    df_info=df_info,
-                ).dataset
-            except DebugFailure as e:
-                logger.warning(f"Failed in name generation {e}")
-                df_name = f"df_{len(current_df_names)+1}"
+    # All dataframes are named concurrently, so the names already taken cannot be passed to the LLM. Any name
+    # collisions are resolved once all the names have been generated.
+    dfs_info = [_get_df_info(df) for df in dfs]
+    df_name_results = await asyncio.gather(
+        *(
+            _aget_pydantic_model(
+                query=query,
+                llm_model=llm,
+                response_model=DfInfo,
+                df_info=_create_df_info_content(df_schema=df_schema, df_sample=df_sample, current_df_names=[]),
+            )
+            for df_schema, df_sample in dfs_info
+        ),
+        return_exceptions=True,
+    )
 
-            # fallback to a less descriptive but unique name if llm fails
-            if df_name in current_df_names:
+    current_df_names = []
+    with tqdm(total=len(dfs), desc="Store df info") as pbar:
+        for df, (df_schema, df_sample), df_name_result in zip(dfs, dfs_info, df_name_results):
+            if isinstance(df_name_result, DebugFailure):
+                logger.warning(f"Failed in name generation {df_name_result}")
                 df_name = f"df_{len(current_df_names)+1}"
+            elif isinstance(df_name_result, Exception):
+                raise df_name_result
+            else:
+                df_name = _clean_df_name(df_name_result.dataset) or f"df_{len(current_df_names)+1}"
+
+            # fallback to a suffixed but unique name if the llm picked a name that is already taken
+            unique_df_name, suffix = df_name, 1
+            while unique_df_name in current_df_names:
+                suffix += 1
+                unique_df_name = f"{df_name}_{suffix}"
+            df_name = unique_df_name
 
             current_df_names.append(df_name)
 
@@ -99,7 +113,7 @@ def _store_df_info(state: GraphState, config: RunnableConfig) -> Dict[str, AllDf
     return {"all_df_metadata": all_df_metadata}
 
 
-def _dashboard_plan(state: GraphState, config: RunnableConfig) -> Dict[str, DashboardPlan]:
+async def _dashboard_plan(state: GraphState, config: RunnableConfig) -> Dict[str, DashboardPlan]:
     """Generate a dashboard plan."""
     node_desc = "Generate dashboard plan"
     pbar = tqdm(total=2, desc=node_desc)
@@ -114,7 +128,7 @@ def _dashboard_plan(state: GraphState, config: RunnableConfig) -> Dict[str, Dash
         None,
     )
     try:
-        dashboard_plan = _get_pydantic_model(
+        dashboard_plan = await _aget_pydantic_model(
             query=query,
             llm_model=llm,
             response_model=DashboardPlan,
@@ -148,14 +162,14 @@ class BuildPageState(BaseModel):
     page_plan: Optional[PagePlan] = None
 
 
-def _build_page(state: BuildPageState, config: RunnableConfig) -> Dict[str, List[vm.Page]]:
+async def _build_page(state: BuildPageState, config: RunnableConfig) -> Dict[str, List[vm.Page]]:
     """Build a page."""
     all_df_metadata = state["all_df_metadata"]
     page_plan = state["page_plan"]
 
     llm = config["configurable"].get("model", None)
     # TODO: this is a hack to get the custom chart code - we should find a much better way to do so
-    page, custom_chart_imports, custom_chart_code = page_plan.create(model=llm, all_df_metadata=all_df_metadata)
+    page, custom_chart_imports, custom_chart_code = await page_plan.acreate(model=llm, all_df_metadata=all_df_metadata)
 
     return {"pages": [page], "custom_charts_imports": [custom_chart_imports], "custom_charts_code": [custom_chart_code]}
 
@@ -179,6 +193,9 @@ def _build_dashboard(state: GraphState) -> Dict[str, vm.Dashboard]:
     return {"dashboard": dashboard}
 
 
+# The compiled graph holds no state between invocations (all of it flows through GraphState), so it is built only once
+# and shared across calls.
+@lru_cache(maxsize=1)
 def _create_and_compile_graph():
     graph = StateGraph(GraphState)
 
@@ -194,6 +211,8 @@ def _create_and_compile_graph():
 
     graph.set_entry_point("_store_df_info")
 
+    # No checkpointer is given so that no snapshot of the state, which holds the user's dataframes, is taken after
+    # each step. The dataframes are only ever passed by reference between nodes.
     runnable = graph.compile()
 
     return runnable
@@ -2,7 +2,9 @@
 
 # ruff: noqa: F821
 
+import asyncio
 import logging
+import weakref
 
 try:
     from pydantic.v1 import BaseModel, ValidationError
@@ -17,6 +19,24 @@ from langchain_core.prompts import ChatPromptTemplate
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of LLM requests in flight at once while building a dashboard. A Graph component counts as a single
+# request, since the LLM calls that `VizroAI.plot` makes for it run one after the other.
+MAX_CONCURRENT_LLM_REQUESTS = 8
+
+# One semaphore per event loop, since an asyncio.Semaphore cannot be shared between event loops.
+_LLM_REQUEST_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _llm_request_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore that bounds the number of concurrent LLM requests in the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _LLM_REQUEST_SEMAPHORES:
+        _LLM_REQUEST_SEMAPHORES[loop] = asyncio.Semaphore(MAX_CONCURRENT_LLM_REQUESTS)
+    return _LLM_REQUEST_SEMAPHORES[loop]
+
+
 BASE_PROMPT = """
 You are a front-end developer with expertise in Plotly, Dash, and the visualization library named Vizro.
 Your goal is to summarize the given specifications into the given Pydantic schema.
@@ -73,13 +93,15 @@ def _get_pydantic_model(
     # TODO: fix typing similar to instructor library, ie the return type should be the same as response_model
     # At the very least it should include the string type of the validation error
     """Get the pydantic output from the LLM model with retry logic."""
+    # Binding the response model is independent of the attempt, so only the prompt changes between retries.
+    structured_llm = llm_model.with_structured_output(response_model)
     for attempt in range(max_retry):
         attempt_is_retry = attempt > 0
         prompt = _create_prompt(retry=attempt_is_retry)
         message_content = _create_message_content(
             query, df_info, str(last_validation_error) if attempt_is_retry else None, retry=attempt_is_retry
         )
-        pydantic_llm = prompt | llm_model.with_structured_output(response_model)
+        pydantic_llm = prompt | structured_llm
         try:
             res = pydantic_llm.invoke(message_content)
         except ValidationError as validation_error:
@@ -90,6 +112,33 @@ def _get_pydantic_model(
     raise last_validation_error
 
 
+async def _aget_pydantic_model(
+    query: str,
+    llm_model: BaseChatModel,
+    response_model: BaseModel,
+    df_info: Optional[Any] = None,
+    max_retry: int = 2,
+) -> BaseModel:
+    """Asynchronous version of `_get_pydantic_model`, bounded by the concurrent LLM request limit."""
+    structured_llm = llm_model.with_structured_output(response_model)
+    for attempt in range(max_retry):
+        attempt_is_retry = attempt > 0
+        prompt = _create_prompt(retry=attempt_is_retry)
+        message_content = _create_message_content(
+            query, df_info, str(last_validation_error) if attempt_is_retry else None, retry=attempt_is_retry
+        )
+        pydantic_llm = prompt | structured_llm
+        try:
+            async with _llm_request_semaphore():
+                res = await pydantic_llm.ainvoke(message_content)
+        except ValidationError as validation_error:
+            last_validation_error = validation_error
+        else:
+            return res  # TODO: problem is response is None, then it returns without raising an error. Wrong typing!
+    # TODO: should this be shifted to logging so that that one can control what output gets shown (e.g. in public demos)
+    raise last_validation_error
+
+
 if __name__ == "__main__":
     import plotly.express as px
     import vizro.models as vm
@@ -1,6 +1,10 @@
 """Component plan model."""
 
+import asyncio
+import contextvars
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import vizro.models as vm
 
@@ -11,13 +15,23 @@ except ImportError:  # pragma: no cov
 from langchain_core.language_models.chat_models import BaseChatModel
 from vizro.tables import dash_ag_grid
 
-from vizro_ai.dashboard._pydantic_output import _get_pydantic_model
+from vizro_ai.dashboard._pydantic_output import (
+    MAX_CONCURRENT_LLM_REQUESTS,
+    _aget_pydantic_model,
+    _get_pydantic_model,
+    _llm_request_semaphore,
+)
 from vizro_ai.dashboard._response_models.types import ComponentType
 from vizro_ai.dashboard.utils import AllDfMetadata, ComponentResult
 from vizro_ai.utils.helper import DebugFailure
 
 logger = logging.getLogger(__name__)
 
+# Building a Graph mostly waits on the LLM, so it runs on its own thread pool rather than on the event loop's default
+# executor, whose size depends on the number of CPUs. Graph builds also take a slot of the LLM request semaphore, so
+# the pool never needs more workers than there can be concurrent LLM requests.
+_GRAPH_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LLM_REQUESTS, thread_name_prefix="vizro_ai_graph")
+
 
 class ComponentPlan(BaseModel):
     """Component plan model."""
@@ -80,26 +94,56 @@ class ComponentPlan(BaseModel):
                     component=vm.AgGrid(id=self.component_id, figure=dash_ag_grid(data_frame=self.df_name))
                 )
             elif self.component_type == "Card":
-                card_prompt = f"""
+                result_proxy = _get_pydantic_model(query=self._card_prompt, llm_model=model, response_model=vm.Card)
+                return self._card_result(result_proxy)
+
+        except (DebugFailure, ValidationError) as e:
+            return self._fallback_result(e)
+
+    async def acreate(self, model: BaseChatModel, all_df_metadata: AllDfMetadata) -> ComponentResult:
+        """Asynchronous version of `create`."""
+        if self.component_type == "Graph":
+            # Graph creation goes through the synchronous `VizroAI.plot`, which also executes the generated chart
+            # code, so it is run in a worker thread rather than blocking the event loop. As with `asyncio.to_thread`,
+            # the current context is propagated to the worker thread.
+            context = contextvars.copy_context()
+            async with _llm_request_semaphore():
+                return await asyncio.get_running_loop().run_in_executor(
+                    _GRAPH_EXECUTOR,
+                    functools.partial(context.run, self.create, model=model, all_df_metadata=all_df_metadata),
+                )
+        elif self.component_type != "Card":
+            return self.create(model=model, all_df_metadata=all_df_metadata)
+
+        try:
+            result_proxy = await _aget_pydantic_model(query=self._card_prompt, llm_model=model, response_model=vm.Card)
+            return self._card_result(result_proxy)
+        except (DebugFailure, ValidationError) as e:
+            return self._fallback_result(e)
+
+    @property
+    def _card_prompt(self) -> str:
+        return f"""
                 The Card uses the dcc.Markdown component from Dash as its underlying text component.
                 Create a card based on the card description: {self.component_description}.
                 """
-                result_proxy = _get_pydantic_model(query=card_prompt, llm_model=model, response_model=vm.Card)
-                proxy_dict = result_proxy.dict()
-                proxy_dict["id"] = self.component_id
-                return ComponentResult(component=vm.Card.parse_obj(proxy_dict))
 
-        except (DebugFailure, ValidationError) as e:
-            logger.warning(
-                f"""
+    def _card_result(self, result_proxy: vm.Card) -> ComponentResult:
+        proxy_dict = result_proxy.dict()
+        proxy_dict["id"] = self.component_id
+        return ComponentResult(component=vm.Card.parse_obj(proxy_dict))
+
+    def _fallback_result(self, error: Exception) -> ComponentResult:
+        logger.warning(
+            f"""
 [FALLBACK] Failed to build `Component`: {self.component_id}.
-Reason: {e}
+Reason: {error}
 Relevant prompt: {self.component_description}
 """
-            )
-            return ComponentResult(
-                component=vm.Card(id=self.component_id, text=f"Failed to build component: {self.component_id}")
-            )
+        )
+        return ComponentResult(
+            component=vm.Card(id=self.component_id, text=f"Failed to build component: {self.component_id}")
+        )
 
 
 if __name__ == "__main__":
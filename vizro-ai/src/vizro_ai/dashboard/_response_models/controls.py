@@ -10,8 +10,9 @@ try:
     from pydantic.v1 import BaseModel, Field, ValidationError, create_model, root_validator, validator
 except ImportError:  # pragma: no cov
     from pydantic import BaseModel, Field, ValidationError, create_model, root_validator, validator
-from vizro_ai.dashboard._pydantic_output import _get_pydantic_model
+from vizro_ai.dashboard._pydantic_output import _aget_pydantic_model
 from vizro_ai.dashboard._response_models.types import ControlType
+from vizro_ai.utils.helper import _run_coroutine
 
 logger = logging.getLogger(__name__)
 
@@ -80,11 +81,13 @@ def _create_filter_proxy(df_cols, df_schema, controllable_components) -> BaseMod
     )
 
 
-def _create_filter(filter_prompt, model, df_cols, df_schema, controllable_components) -> vm.Filter:
+async def _create_filter(filter_prompt, model, df_cols, df_schema, controllable_components) -> vm.Filter:
     result_proxy = _create_filter_proxy(
         df_cols=df_cols, df_schema=df_schema, controllable_components=controllable_components
     )
-    proxy = _get_pydantic_model(query=filter_prompt, llm_model=model, response_model=result_proxy, df_info=df_schema)
+    proxy = await _aget_pydantic_model(
+        query=filter_prompt, llm_model=model, response_model=result_proxy, df_info=df_schema
+    )
     return vm.Filter.parse_obj(proxy.dict(exclude_unset=True))
 
 
@@ -109,6 +112,12 @@ class ControlPlan(BaseModel):
     )
 
     def create(self, model, controllable_components, all_df_metadata) -> Optional[vm.Filter]:
+        """Synchronous version of `acreate`."""
+        return _run_coroutine(
+            self.acreate(model=model, controllable_components=controllable_components, all_df_metadata=all_df_metadata)
+        )
+
+    async def acreate(self, model, controllable_components, all_df_metadata) -> Optional[vm.Filter]:
         """Create the control."""
         filter_prompt = f"""
         Create a filter from the following instructions: <{self.control_description}>. Do not make up
@@ -124,7 +133,7 @@ class ControlPlan(BaseModel):
 
         try:
             if self.control_type == "Filter":
-                res = _create_filter(
+                res = await _create_filter(
                     filter_prompt=filter_prompt,
                     model=model,
                     df_cols=_df_cols,
@@ -1,5 +1,6 @@
 """Data Summary Node."""
 
+import string
 from typing import Dict, List, Tuple
 
 import pandas as pd
@@ -19,6 +20,9 @@ Provide descriptive name mainly based on the data context above.
 User request content is just for context.
 """
 
+# Maps every ASCII character other than lowercase letters, digits and underscores to an underscore.
+_DF_NAME_TRANSLATION = {i: "_" for i in range(128) if chr(i) not in string.ascii_lowercase + string.digits + "_"}
+
 
 class DfInfo(BaseModel):
     """Data Info output."""
@@ -33,6 +37,14 @@ def _get_df_info(df: pd.DataFrame) -> Tuple[Dict[str, str], pd.DataFrame]:
     return formatted_pairs, df_sample
 
 
+def _clean_df_name(df_name: str) -> str:
+    """Clean the dataframe name into small snake case."""
+    cleaned_df_name = df_name.lower().translate(_DF_NAME_TRANSLATION)
+    while "__" in cleaned_df_name:
+        cleaned_df_name = cleaned_df_name.replace("__", "_")
+    return cleaned_df_name.strip("_")
+
+
 def _create_df_info_content(df_schema: Dict[str, str], df_sample: pd.DataFrame, current_df_names: List[str]) -> dict:
     """Create the message content for the dataframe summarization."""
     return DF_SUMMARY_PROMPT.format(df_sample=df_sample, df_schema=df_schema, current_df_names=current_df_names)
@@ -1,5 +1,6 @@
 """Page plan model."""
 
+import asyncio
 import logging
 import re
 from collections import Counter
@@ -16,6 +17,7 @@ from vizro_ai.dashboard._response_models.components import ComponentPlan
 from vizro_ai.dashboard._response_models.controls import ControlPlan
 from vizro_ai.dashboard._response_models.layout import LayoutPlan
 from vizro_ai.dashboard.utils import _execute_step
+from vizro_ai.utils.helper import _run_coroutine
 
 logger = logging.getLogger(__name__)
 
@@ -87,91 +89,94 @@ class PagePlan(BaseModel):
         self._components_imports = None
 
     # TODO: Add type hints on this page!
-    def _get_components_and_code(self, model, all_df_metadata):
+    async def _get_components_and_code(self, model, all_df_metadata):
         if self._components is None:
-            self._components, self._components_imports, self._components_code = self._build_components(
+            self._components, self._components_imports, self._components_code = await self._build_components(
                 model=model, all_df_metadata=all_df_metadata
             )
         return self._components, self._components_imports, self._components_code
 
-    def _build_components(self, model, all_df_metadata):
+    async def _build_components(self, model, all_df_metadata):
         components = []
         components_code = []
         components_imports = []
-        component_log = tqdm(total=0, bar_format="{desc}", leave=False)
         with tqdm(
             total=len(self.components_plan),
             desc=f"Currently Building ... [Page] <{self.title}> components",
             leave=False,
         ) as pbar:
-            for component_plan in self.components_plan:
-                component_log.set_description_str(f"[Page] <{self.title}>: [Component] {component_plan.component_id}")
+
+            async def _create_component(component_plan):
+                result = await component_plan.acreate(model=model, all_df_metadata=all_df_metadata)
                 pbar.update(1)
-                result = component_plan.create(model=model, all_df_metadata=all_df_metadata)
-                component, imports, code = result.component, result.imports, result.code
-
-                components.append(component)
-
-                # Store the code for the component, currently this only applies to Graph component
-                component_code = {}
-                component_imports = {}
-                if code:
-                    component_code[component_plan.component_id] = code
-                    components_code.append(component_code)
-                    component_imports[component_plan.component_id] = imports
-                    components_imports.append(component_imports)
-        component_log.close()
+                return result
+
+            results = await asyncio.gather(
+                *(_create_component(component_plan) for component_plan in self.components_plan)
+            )
+
+        for component_plan, result in zip(self.components_plan, results):
+            component, imports, code = result.component, result.imports, result.code
+
+            components.append(component)
+
+            # Store the code for the component, currently this only applies to Graph component
+            component_code = {}
+            component_imports = {}
+            if code:
+                component_code[component_plan.component_id] = code
+                components_code.append(component_code)
+                component_imports[component_plan.component_id] = imports
+                components_imports.append(component_imports)
         return components, components_imports, components_code
 
-    def _get_layout(self, model, all_df_metadata):
+    def _get_layout(self):
         if self._layout is None:
-            self._layout = self._build_layout(model, all_df_metadata)
+            self._layout = self._build_layout()
         return self._layout
 
-    def _build_layout(self, model, all_df_metadata):
+    def _build_layout(self):
         if self.layout_plan is None:
             return None
-        return self.layout_plan.create(
-            component_ids=self._get_component_ids(model=model, all_df_metadata=all_df_metadata),
-        )
+        return self.layout_plan.create(component_ids=self._get_component_ids())
 
-    def _get_controls(self, model, all_df_metadata):
+    async def _get_controls(self, model, all_df_metadata):
         if self._controls is None:
-            self._controls = self._build_controls(model=model, all_df_metadata=all_df_metadata)
+            self._controls = await self._build_controls(model=model, all_df_metadata=all_df_metadata)
         return self._controls
 
-    def _controllable_components(self, model, all_df_metadata):
-        return [
-            comp.id
-            # TODO: improve on taking element by position
-            for comp in self._get_components_and_code(model=model, all_df_metadata=all_df_metadata)[0]
-            if isinstance(comp, (vm.Graph, vm.AgGrid))
-        ]
+    # The helpers below read the components, so they must only be used once the components have been built.
+    def _controllable_components(self):
+        return [comp.id for comp in self._components if isinstance(comp, (vm.Graph, vm.AgGrid))]
 
-    def _get_component_ids(self, model, all_df_metadata):
-        return [comp.id for comp in self._get_components_and_code(model=model, all_df_metadata=all_df_metadata)[0]]
+    def _get_component_ids(self):
+        return [comp.id for comp in self._components]
 
-    def _build_controls(self, model, all_df_metadata):
-        controls = []
+    async def _build_controls(self, model, all_df_metadata):
+        controllable_components = self._controllable_components()
         with tqdm(
             total=len(self.controls_plan),
             desc=f"Currently Building ... [Page] <{self.title}> controls",
             leave=False,
         ) as pbar:
-            for control_plan in self.controls_plan:
-                pbar.update(1)
-                control = control_plan.create(
-                    model=model,
-                    controllable_components=self._controllable_components(model=model, all_df_metadata=all_df_metadata),
-                    all_df_metadata=all_df_metadata,
+
+            async def _create_control(control_plan):
+                control = await control_plan.acreate(
+                    model=model, controllable_components=controllable_components, all_df_metadata=all_df_metadata
                 )
-                if control:
-                    controls.append(control)
+                pbar.update(1)
+                return control
+
+            controls = await asyncio.gather(*(_create_control(control_plan) for control_plan in self.controls_plan))
 
-        return controls
+        return [control for control in controls if control]
 
     def create(self, model, all_df_metadata) -> Tuple[Union[vm.Page, None], Optional[str], Optional[str]]:
-        """Create the page."""
+        """Synchronous version of `acreate`."""
+        return _run_coroutine(self.acreate(model=model, all_df_metadata=all_df_metadata))
+
+    async def acreate(self, model, all_df_metadata) -> Tuple[Union[vm.Page, None], Optional[str], Optional[str]]:
+        """Create the page, building its components and then its controls concurrently."""
         page_desc = f"Building page: {self.title}"
         logger.info(page_desc)
         pbar = tqdm(total=5, desc=page_desc)
@@ -180,14 +185,14 @@ class PagePlan(BaseModel):
         components, components_imports, components_code = _execute_step(
             pbar,
             page_desc + " --> add components",
-            self._get_components_and_code(model=model, all_df_metadata=all_df_metadata),
+            await self._get_components_and_code(model=model, all_df_metadata=all_df_metadata),
         )
         controls = _execute_step(
-            pbar, page_desc + " --> add controls", self._get_controls(model=model, all_df_metadata=all_df_metadata)
-        )
-        layout = _execute_step(
-            pbar, page_desc + " --> add layout", self._get_layout(model=model, all_df_metadata=all_df_metadata)
+            pbar,
+            page_desc + " --> add controls",
+            await self._get_controls(model=model, all_df_metadata=all_df_metadata),
         )
+        layout = _execute_step(pbar, page_desc + " --> add layout", self._get_layout())
 
         try:
             page = vm.Page(title=title, components=components, controls=controls, layout=layout)
@@ -144,8 +144,9 @@ and it should be the first argument of the chart."""
         """
         chart_name = chart_name or CUSTOM_CHART_NAME
         code_to_execute = self._get_complete_code(chart_name=chart_name, vizro=vizro)
-        namespace = globals()
-        namespace = _exec_code(code_to_execute, namespace)
+        # Each execution gets its own copy of the module namespace so that concurrently built charts cannot pick up
+        # one another's chart function.
+        namespace = _exec_code(code_to_execute, globals().copy())
         chart = namespace[f"{chart_name}"]
         return chart(data_frame)
 
@@ -171,8 +172,7 @@ class ChartPlanFactory:
                     f"Produced code failed the safeguard validation: <{e}>. Please check the code and try again."
                 )
             try:
-                namespace = globals()
-                namespace = _exec_code(code_to_validate, namespace)
+                namespace = _exec_code(code_to_validate, globals().copy())
                 custom_chart = namespace[f"{CUSTOM_CHART_NAME}"]
                 fig = custom_chart(data_frame.sample(10, replace=True))
             except Exception as e:
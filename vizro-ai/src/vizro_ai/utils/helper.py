@@ -1,9 +1,14 @@
 """Helper Functions For Vizro AI."""
 
-from typing import Tuple
+import asyncio
+import threading
+from contextlib import suppress
+from typing import Any, Coroutine, Optional, Tuple, TypeVar
 
 import pandas as pd
 
+T = TypeVar("T")
+
 
 def _get_df_info(df: pd.DataFrame, n_sample: int = 5) -> Tuple[str, str]:
     """Get the dataframe schema and head info as string."""
@@ -12,6 +17,38 @@ def _get_df_info(df: pd.DataFrame, n_sample: int = 5) -> Tuple[str, str]:
     return schema_string, df.sample(n_sample, replace=True, random_state=19).to_markdown()
 
 
+_EVENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_EVENT_LOOP_LOCK = threading.Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the long-lived event loop that `_run_coroutine` uses, starting it in a background thread on first use."""
+    global _EVENT_LOOP
+    with _EVENT_LOOP_LOCK:
+        if _EVENT_LOOP is None:
+            _EVENT_LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_EVENT_LOOP.run_forever, name="vizro_ai_event_loop", daemon=True).start()
+    return _EVENT_LOOP
+
+
+def _run_coroutine(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code, also when called from inside a running event loop.
+
+    Every coroutine runs on the same long-lived event loop rather than in a new `asyncio.run` loop per call. Async LLM
+    clients keep their connection pool bound to the event loop they were first used on, so a model that is reused
+    across calls must always be used from the same event loop.
+    """
+    loop = _get_event_loop()
+    running_loop = None
+    with suppress(RuntimeError):
+        running_loop = asyncio.get_running_loop()
+    if running_loop is loop:
+        # Waiting for the result here would block the very loop that has to produce it.
+        coroutine.close()
+        raise RuntimeError("_run_coroutine cannot be called from a coroutine running on its own event loop.")
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+
 class DebugFailure(Exception):
     """Debug Failure."""
 
@@ -1,11 +1,31 @@
+from typing import Any, List
+
 import pandas as pd
 import pytest
+from langchain.output_parsers import PydanticOutputParser
+from langchain_community.llms.fake import FakeListLLM
 from langchain_core.messages import HumanMessage
 
 from vizro_ai.dashboard._graph.dashboard_creation import GraphState
 from vizro_ai.dashboard.utils import AllDfMetadata, DfMetadata
 
 
+class MockStructuredOutputLLM(FakeListLLM):
+    def bind_tools(self, tools: List[Any]):
+        return super().bind(tools=tools)
+
+    def with_structured_output(self, schema):
+        llm = self
+        output_parser = PydanticOutputParser(pydantic_object=schema)
+        return llm | output_parser
+
+
+@pytest.fixture
+def fake_llm_df_name():
+    response = ['{"dataset":"gdp"}']
+    return MockStructuredOutputLLM(responses=response)
+
+
 @pytest.fixture
 def dataframes():
     return [pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": [4, 5, 6, 7, 8]})]
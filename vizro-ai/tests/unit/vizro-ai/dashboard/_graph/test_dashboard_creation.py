@@ -1,3 +1,5 @@
+import asyncio
+
 import pandas as pd
 import pytest
 
@@ -8,7 +10,7 @@ except ImportError:  # pragma: no cov
 
 from langchain_core.messages import HumanMessage
 
-from vizro_ai.dashboard._graph.dashboard_creation import GraphState
+from vizro_ai.dashboard._graph.dashboard_creation import GraphState, _create_and_compile_graph, _store_df_info
 
 
 class TestConfig:
@@ -37,3 +39,19 @@ class TestConfig:
                 all_df_metadata=df_metadata,
                 pages=[],
             )
+
+
+class TestStoreDfInfo:
+    """Test _store_df_info node."""
+
+    def test_store_df_info_unique_names(self, graph_state, fake_llm_df_name):
+        graph_state.dfs.append(pd.DataFrame({"c": [1, 2, 3]}))
+        result = asyncio.run(_store_df_info(graph_state, config={"configurable": {"model": fake_llm_df_name}}))
+
+        all_df_metadata = result["all_df_metadata"].all_df_metadata
+        assert list(all_df_metadata) == ["gdp_chart", "gdp", "gdp_2"]
+        assert all_df_metadata["gdp_2"].df is graph_state.dfs[1]
+
+
+def test_create_and_compile_graph_cached():
+    assert _create_and_compile_graph() is _create_and_compile_graph()
@@ -1,3 +1,4 @@
+import asyncio
 import re
 
 import pytest
@@ -49,3 +50,17 @@ class TestComponentCreate:
 
         assert card.dict(exclude={"id": True}) == expected_card.dict(exclude={"id": True})
         assert code is None
+
+    def test_acreate_card(self, fake_llm_card, expected_card):
+        # A separate component ID, since test_create_card has already registered card_1 in the model manager.
+        component_plan_card = ComponentPlan(
+            component_type="Card",
+            component_description="This is a card",
+            component_id="card_2",
+            df_name="N/A",
+        )
+        result = asyncio.run(component_plan_card.acreate(model=fake_llm_card, all_df_metadata=None))
+        card, code = result.component, result.code
+
+        assert card.dict(exclude={"id": True}) == expected_card.dict(exclude={"id": True})
+        assert code is None
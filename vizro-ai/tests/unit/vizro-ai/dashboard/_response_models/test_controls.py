@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import pytest
@@ -57,6 +58,21 @@ class TestControlCreate:
             exclude={"id": True}
         )
 
+    def test_control_acreate_valid(self, fake_llm_filter, controllable_components, df_metadata):
+        control_plan = ControlPlan(
+            control_type="Filter",
+            control_description="Create a parameter that targets the data based on the column 'a'.",
+            df_name="bar_chart",
+        )
+        result = asyncio.run(
+            control_plan.acreate(
+                model=fake_llm_filter, controllable_components=controllable_components, all_df_metadata=df_metadata
+            )
+        )
+        assert result.dict(exclude={"id": True}) == vm.Filter(targets=["bar_chart"], column="a").dict(
+            exclude={"id": True}
+        )
+
     def test_control_create_invalid_df_name(
         self, fake_llm_filter, df_metadata, caplog
     ):  # testing the fallback when an invalid dataframe name is provided to ControlPlan.
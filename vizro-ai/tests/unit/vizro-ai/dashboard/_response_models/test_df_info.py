@@ -1,6 +1,7 @@
+import pytest
 from pandas.testing import assert_frame_equal
 
-from vizro_ai.dashboard._response_models.df_info import _get_df_info
+from vizro_ai.dashboard._response_models.df_info import _clean_df_name, _get_df_info
 
 
 def test_get_df_info(df, df_schema, df_sample):
@@ -8,3 +9,26 @@ def test_get_df_info(df, df_schema, df_sample):
 
     assert actual_df_schema == df_schema
     assert_frame_equal(actual_df_sample, df_sample)
+
+
+def test_get_df_info_reflects_dtype_change(df):
+    df["a"] = df["a"].astype(float)
+    df_schema, _ = _get_df_info(df=df)
+
+    assert df_schema["a"] == "float64"
+
+
+@pytest.mark.parametrize(
+    "df_name, expected",
+    [
+        ("gdp", "gdp"),
+        ("world_gdp", "world_gdp"),
+        ("World GDP", "world_gdp"),
+        ("__World -- GDP!__", "world_gdp"),
+        ("gdp_2024", "gdp_2024"),
+        ("CAFÉ Sales", "café_sales"),
+        ("???", ""),
+    ],
+)
+def test_clean_df_name(df_name, expected):
+    assert _clean_df_name(df_name) == expected
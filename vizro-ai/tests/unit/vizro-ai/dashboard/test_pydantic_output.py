@@ -1,7 +1,15 @@
+import asyncio
+
 import pytest
 import vizro.models as vm
 
-from vizro_ai.dashboard._pydantic_output import _create_message_content, _create_prompt_template, _get_pydantic_model
+from vizro_ai.dashboard._pydantic_output import (
+    MAX_CONCURRENT_LLM_REQUESTS,
+    _create_message_content,
+    _create_prompt_template,
+    _get_pydantic_model,
+    _llm_request_semaphore,
+)
 
 
 def test_get_pydantic_model_valid(component_description, fake_llm, expected_card):
@@ -32,3 +40,15 @@ def test_create_prompt_template():
     additional_info = "Pay special attention to the following error: {validation_error}"
     model = _create_prompt_template(additional_info)
     assert additional_info in model.messages[0].prompt.template
+
+
+def test_llm_request_semaphore():
+    async def get_semaphores():
+        return _llm_request_semaphore(), _llm_request_semaphore()
+
+    first_semaphore, same_loop_semaphore = asyncio.run(get_semaphores())
+    other_loop_semaphore, _ = asyncio.run(get_semaphores())
+
+    assert first_semaphore is same_loop_semaphore
+    assert first_semaphore is not other_loop_semaphore
+    assert first_semaphore._value == MAX_CONCURRENT_LLM_REQUESTS
@@ -196,3 +196,9 @@ def {expected_chart_name}(data_frame):
         def test_get_fig_object(self, chart_plan, vizro, expected_fig):
             fig = chart_plan.get_fig_object(data_frame=df, vizro=vizro)
             assert fig == expected_fig
+
+        def test_get_fig_object_does_not_modify_module_namespace(self, chart_plan):
+            from vizro_ai.plot import _response_models
+
+            chart_plan.get_fig_object(data_frame=df, chart_name="isolated_chart")
+            assert not hasattr(_response_models, "isolated_chart")
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Any, List
+
+import pandas as pd
+import pytest
+import vizro.models as vm
+from langchain.output_parsers import PydanticOutputParser
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from vizro import Vizro
+
+from vizro_ai import VizroAI
+
+# Event loops that LoopBoundChatModel has been used on.
+_used_event_loops: List[asyncio.AbstractEventLoop] = []
+
+
+class LoopBoundChatModel(FakeListChatModel):
+    """Fake chat model that, like an async HTTP client with a connection pool, only works on its first event loop."""
+
+    model_name: str = "fake-model"
+
+    def with_structured_output(self, schema):
+        return self | PydanticOutputParser(pydantic_object=schema)
+
+    async def _agenerate(self, *args: Any, **kwargs: Any):
+        loop = asyncio.get_running_loop()
+        if _used_event_loops and _used_event_loops[0] is not loop:
+            raise RuntimeError("Connection pool is bound to a different event loop.")
+        _used_event_loops.append(loop)
+        return await super()._agenerate(*args, **kwargs)
+
+
+@pytest.fixture
+def loop_bound_llm():
+    _used_event_loops.clear()
+    return LoopBoundChatModel(
+        responses=[
+            '{"dataset": "gdp"}',
+            '{"title": "Dashboard", "pages": [{"title": "Page", "components_plan": [{"component_type": "Card", '
+            '"component_description": "Create a card saying: this is a card.", "component_id": "intro_card", '
+            '"df_name": "N/A"}]}]}',
+            '{"text": "this is a card", "href": ""}',
+        ]
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_managers():
+    Vizro._reset()
+    yield
+    Vizro._reset()
+
+
+def test_dashboard_called_twice(loop_bound_llm):
+    vizro_ai = VizroAI(model=loop_bound_llm)
+    df = pd.DataFrame({"country": ["A", "B"], "gdp": [1, 2]})
+
+    for _ in range(2):
+        Vizro._reset()
+        dashboard = vizro_ai.dashboard(dfs=[df], user_input="Create a page with a card.")
+
+        assert isinstance(dashboard, vm.Dashboard)
+        assert dashboard.pages[0].components[0].text == "this is a card"
+
+    assert len(set(_used_event_loops)) == 1
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from vizro_ai.utils.helper import _run_coroutine
+
+
+async def _running_loop():
+    await asyncio.sleep(0)
+    return asyncio.get_running_loop()
+
+
+def test_run_coroutine_reuses_event_loop():
+    # Async LLM clients are bound to the event loop they are first used on, so every call must use the same loop.
+    first_loop = _run_coroutine(_running_loop())
+
+    assert _run_coroutine(_running_loop()) is first_loop
+    assert not first_loop.is_closed()
+
+
+def test_run_coroutine_inside_running_loop():
+    async def run_nested():
+        return asyncio.get_running_loop(), _run_coroutine(_running_loop())
+
+    outer_loop, inner_loop = asyncio.run(run_nested())
+
+    assert inner_loop is not outer_loop
+    assert inner_loop is _run_coroutine(_running_loop())
+
+
+def test_run_coroutine_from_own_event_loop():
+    async def run_nested():
+        return _run_coroutine(_running_loop())
+
+    with pytest.raises(RuntimeError, match="cannot be called from a coroutine running on its own event loop"):
+        _run_coroutine(run_nested())
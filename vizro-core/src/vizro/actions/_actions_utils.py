@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, TypedDict, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, TypedDict, Union
 
 import pandas as pd
 
@@ -180,12 +180,27 @@ def _get_targets_data_and_config(
 ):
     all_filtered_data = {}
     all_parameterized_config = {}
+    # Data already loaded in this call as (data source name, data loading arguments, data). Targets that share a data
+    # source and data loading arguments then only load the data once. Each further target gets its own copy, just like
+    # it would from load(), so that a figure function modifying its data_frame cannot affect the other targets.
+    loaded_data: List[Tuple[str, Dict[str, Any], pd.DataFrame]] = []
 
     for target in targets:
         # parametrized_config includes a key "data_frame" that is used in the data loading function.
         parameterized_config = _get_parametrized_config(target=target, ctd_parameters=ctds_parameters)
         data_source_name = model_manager[target]["data_frame"]
-        data_frame = data_manager[data_source_name].load(**parameterized_config["data_frame"])
+        load_kwargs = parameterized_config["data_frame"]
+        data_frame = next(
+            (
+                loaded_data_frame.copy()
+                for loaded_data_source_name, loaded_kwargs, loaded_data_frame in loaded_data
+                if loaded_data_source_name == data_source_name and loaded_kwargs == load_kwargs
+            ),
+            None,
+        )
+        if data_frame is None:
+            data_frame = data_manager[data_source_name].load(**load_kwargs)
+            loaded_data.append((data_source_name, load_kwargs, data_frame))
 
         filtered_data = _apply_filters(data_frame=data_frame, ctds_filters=ctds_filter, target=target)
         filtered_data = _apply_filter_interaction(
@@ -1,8 +1,9 @@
 import importlib.util
 import logging
 from collections.abc import Collection, Mapping
+from functools import partial
 from pprint import pformat
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from dash import Input, Output, State, callback, html
 
@@ -19,6 +20,63 @@ from vizro.models.types import CapturedCallable
 logger = logging.getLogger(__name__)
 
 
+class _LazyPformat:
+    """Pretty-prints an object only when a log message using it is actually emitted."""
+
+    __slots__ = ("_object", "_kwargs")
+
+    def __init__(self, obj: Any, **kwargs: Any):
+        self._object = obj
+        self._kwargs = kwargs
+
+    def __str__(self) -> str:
+        return pformat(self._object, **self._kwargs)
+
+
+def _validate_return_value_dict(return_value: Any, outputs: Dict[str, Output]) -> None:
+    if not isinstance(return_value, Mapping):
+        raise ValueError(
+            "Action function has not returned a dictionary-like object "
+            "but the action's defined outputs are a dictionary."
+        )
+    if set(outputs) != set(return_value):
+        raise ValueError(
+            f"Keys of action's returned value {set(return_value) or {}} "
+            f"do not match the action's defined outputs {set(outputs) or {}})."
+        )
+
+
+def _validate_return_value_list(return_value: Any, outputs: List[Output]) -> None:
+    if not isinstance(return_value, Collection):
+        raise ValueError(
+            "Action function has not returned a list-like object but the action's defined outputs are a list."
+        )
+    if len(return_value) != len(outputs):
+        raise ValueError(
+            f"Number of action's returned elements {len(return_value)} does not match the number"
+            f" of action's defined outputs {len(outputs)}."
+        )
+
+
+# Checks of the action function's return value, looked up by the type of the action's defined outputs. A single
+# Output needs no checks since it can hold any value.
+_RETURN_VALUE_VALIDATORS: Dict[type, Callable[[Any, Any], None]] = {
+    dict: _validate_return_value_dict,
+    list: _validate_return_value_list,
+}
+
+
+def _get_return_value_validator(outputs: Any) -> Optional[Callable[[Any, Any], None]]:
+    # Looking up the exact type is the fast path; subclasses of dict and list fall back to an isinstance check so that
+    # they are not silently left unvalidated.
+    if (validate_return_value := _RETURN_VALUE_VALIDATORS.get(type(outputs))) is not None:
+        return validate_return_value
+    return next(
+        (validate for output_type, validate in _RETURN_VALUE_VALIDATORS.items() if isinstance(outputs, output_type)),
+        None,
+    )
+
+
 class Action(VizroBaseModel):
     """Action to be inserted into `actions` of relevant component.
 
@@ -103,11 +161,11 @@ class Action(VizroBaseModel):
         outputs: Union[Dict[str, Output], List[Output], Output, None],
     ) -> Any:
         logger.debug("===== Running action with id %s, function %s =====", self.id, self.function._function.__name__)
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("Action inputs:\n%s", pformat(inputs, depth=3, width=200))
-            logger.debug("Action outputs:\n%s", pformat(outputs, width=200))
+        logger.debug("Action inputs:\n%s", _LazyPformat(inputs, depth=3, width=200))
+        logger.debug("Action outputs:\n%s", _LazyPformat(outputs, width=200))
 
-        if isinstance(inputs, Mapping):
+        # Dash always provides the inputs as either a dict or a list.
+        if type(inputs) is dict:
             return_value = self.function(**inputs)
         else:
             return_value = self.function(*inputs)
@@ -117,27 +175,8 @@ class Action(VizroBaseModel):
         if not outputs:
             if return_value is not None:
                 raise ValueError("Action function has returned a value but the action has no defined outputs.")
-        elif isinstance(outputs, dict):
-            if not isinstance(return_value, Mapping):
-                raise ValueError(
-                    "Action function has not returned a dictionary-like object "
-                    "but the action's defined outputs are a dictionary."
-                )
-            if set(outputs) != set(return_value):
-                raise ValueError(
-                    f"Keys of action's returned value {set(return_value) or {}} "
-                    f"do not match the action's defined outputs {set(outputs) or {}})."
-                )
-        elif isinstance(outputs, list):
-            if not isinstance(return_value, Collection):
-                raise ValueError(
-                    "Action function has not returned a list-like object but the action's defined outputs are a list."
-                )
-            if len(return_value) != len(outputs):
-                raise ValueError(
-                    f"Number of action's returned elements {len(return_value)} does not match the number"
-                    f" of action's defined outputs {len(outputs)}."
-                )
+        elif validate_return_value := _get_return_value_validator(outputs):
+            validate_return_value(return_value, outputs)
 
         # If no error has been raised then the return_value is good and is returned as it is.
         # This could be a list of outputs, dictionary of outputs or any single value including None.
@@ -173,15 +212,28 @@ class Action(VizroBaseModel):
             self.id,
             self.function._function.__name__,
         )
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("Callback inputs:\n%s", pformat(callback_inputs["external"], width=200))
-            logger.debug("Callback outputs:\n%s", pformat(callback_outputs.get("external"), width=200))
+        logger.debug("Callback inputs:\n%s", _LazyPformat(callback_inputs["external"], width=200))
+        logger.debug("Callback outputs:\n%s", _LazyPformat(callback_outputs.get("external"), width=200))
 
-        @callback(output=callback_outputs, inputs=callback_inputs, prevent_initial_call=True)
-        def callback_wrapper(external: Union[List[Any], Dict[str, Any]], internal: Dict[str, Any]) -> Dict[str, Any]:
-            return_value = self._action_callback_function(inputs=external, outputs=callback_outputs.get("external"))
-            if "external" in callback_outputs:
-                return {"internal": {"action_finished": None}, "external": return_value}
-            return {"internal": {"action_finished": None}}
+        callback(output=callback_outputs, inputs=callback_inputs, prevent_initial_call=True)(
+            partial(_action_callback_wrapper, self, callback_outputs.get("external"))
+        )
 
         return html.Div(id=f"{self.id}_action_model_components_div", children=action_components, hidden=True)
+
+
+def _action_callback_wrapper(
+    action: Action,
+    outputs: Union[List[Output], Dict[str, Output], None],
+    external: Union[List[Any], Dict[str, Any]],
+    internal: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Runs the action function for the Dash callback registered by `Action.build`.
+
+    `action` and `outputs` (or None if the action has no outputs) are bound with `functools.partial` so that no closure
+    is created per action.
+    """
+    return_value = action._action_callback_function(inputs=external, outputs=outputs)
+    if outputs is not None:
+        return {"internal": {"action_finished": None}, "external": return_value}
+    return {"internal": {"action_finished": None}}
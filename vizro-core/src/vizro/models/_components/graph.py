@@ -1,7 +1,7 @@
 import logging
 import warnings
 from contextlib import suppress
-from typing import Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple, cast
 
 from dash import ClientsideFunction, Input, Output, State, clientside_callback, dcc, html, set_props
 from dash.exceptions import MissingCallbackContextException
@@ -12,6 +12,8 @@ try:
 except ImportError:  # pragma: no cov
     from pydantic import Field, PrivateAttr, validator
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from vizro.actions._actions_utils import CallbackTriggerDict, _get_component_actions
@@ -25,6 +27,35 @@ from vizro.models.types import CapturedCallable
 
 logger = logging.getLogger(__name__)
 
+# The empty figure here is just a placeholder designed to be replaced by the actual figure when the filters etc. are
+# applied. It only appears on the screen for a brief instant, but we need to make sure it's transparent and has no axes
+# so it doesn't draw anything on the screen which would flicker away when the graph callback is executed to make the
+# dcc.Loading icon appear. The figure itself is created in build() so that it picks up the plotly template that is
+# active at that point.
+_PLACEHOLDER_LAYOUT = {
+    "paper_bgcolor": "rgba(0,0,0,0)",
+    "plot_bgcolor": "rgba(0,0,0,0)",
+    "xaxis": {"visible": False},
+    "yaxis": {"visible": False},
+}
+_GRAPH_CONFIG = {"autosizable": True, "frameMargins": 0, "responsive": True}
+
+
+def _equals_mask(series: pd.Series, value: Any) -> npt.NDArray[np.bool_]:
+    """Returns a boolean mask of where `series` equals `value`.
+
+    Numeric values compared with plain numeric columns go straight to NumPy; everything else (strings, dates, missing
+    values, extension dtypes) keeps the matching semantics of `isin`.
+    """
+    if (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and isinstance(series.dtype, np.dtype)
+        and series.dtype.kind in "iuf"
+    ):
+        return series.to_numpy() == value
+    return series.isin([value]).to_numpy()
+
 
 class Graph(VizroBaseModel):
     """Wrapper for `dcc.Graph` to visualize charts in dashboard.
@@ -62,6 +93,9 @@ class Graph(VizroBaseModel):
 
     # Component properties for actions and interactions
     _output_component_property: str = PrivateAttr("figure")
+    # Targets of the graph's filter_interaction actions, stored with the `actions` they were computed from so they are
+    # recomputed if `actions` is reassigned.
+    _filter_interaction_targets: Optional[Tuple[List[Action], Set[ModelID]]] = PrivateAttr(None)
 
     # Validators
     _set_actions = _action_validator_factory("clickData")
@@ -104,6 +138,17 @@ class Graph(VizroBaseModel):
             "modelID": State(component_id=self.id, component_property="id"),  # required, to determine triggered model
         }
 
+    def _get_filter_interaction_targets(self) -> Set[ModelID]:
+        if self._filter_interaction_targets is None or self._filter_interaction_targets[0] is not self.actions:
+            targets = {
+                target
+                for action in _get_component_actions(self)
+                if action.function._function.__name__ == "filter_interaction"
+                for target in action.function["targets"]
+            }
+            self._filter_interaction_targets = (self.actions, targets)
+        return self._filter_interaction_targets[1]
+
     def _filter_interaction(
         self, data_frame: pd.DataFrame, target: str, ctd_filter_interaction: Dict[str, CallbackTriggerDict]
     ) -> pd.DataFrame:
@@ -114,9 +159,9 @@ class Graph(VizroBaseModel):
             return data_frame
 
         source_graph_id: ModelID = ctd_click_data["id"]
-        source_graph_actions = _get_component_actions(model_manager[source_graph_id])
+        source_graph = cast(Graph, model_manager[source_graph_id])
         try:
-            custom_data_columns = model_manager[source_graph_id]["custom_data"]
+            custom_data_columns = source_graph["custom_data"]
         except KeyError as exc:
             raise KeyError(
                 f"Missing 'custom_data' for the source graph with id {source_graph_id}. "
@@ -128,21 +173,22 @@ class Graph(VizroBaseModel):
 
         customdata = ctd_click_data["value"]["points"][0]["customdata"]
 
-        for action in source_graph_actions:
-            if action.function._function.__name__ != "filter_interaction" or target not in action.function["targets"]:
-                continue
-            for custom_data_idx, column in enumerate(custom_data_columns):
-                data_frame = data_frame[data_frame[column].isin([customdata[custom_data_idx]])]
+        if target not in source_graph._get_filter_interaction_targets():
+            return data_frame
+
+        # Combine the conditions for all custom_data columns into one mask so that data_frame is only indexed once.
+        mask = np.ones(len(data_frame), dtype=bool)
+        for custom_data_idx, column in enumerate(custom_data_columns):
+            mask &= _equals_mask(data_frame[column], customdata[custom_data_idx])
 
-        return data_frame
+        return data_frame[mask]
 
     @staticmethod
     def _optimise_fig_layout_for_dashboard(fig):
         """Post layout updates to visually enhance charts used inside dashboard."""
-        if fig.layout.title.text:
-            if fig.layout.margin.t is None:
-                # Reduce `margin_t` if not explicitly set.
-                fig.update_layout(margin_t=64)
+        if fig.layout.margin.t is None and fig.layout.title.text:
+            # Reduce `margin_t` if not explicitly set.
+            fig.update_layout(margin_t=64)
 
         return fig
 
@@ -173,27 +219,12 @@ class Graph(VizroBaseModel):
             prevent_initial_call=True,
         )
 
-        # The empty figure here is just a placeholder designed to be replaced by the actual figure when the filters
-        # etc. are applied. It only appears on the screen for a brief instant, but we need to make sure it's
-        # transparent and has no axes so it doesn't draw anything on the screen which would flicker away when the
-        # graph callback is executed to make the dcc.Loading icon appear.
         return dcc.Loading(
             children=html.Div(
                 children=[
                     html.H3(self.title, className="figure-title", id=f"{self.id}_title") if self.title else None,
                     dcc.Markdown(self.header, className="figure-header") if self.header else None,
-                    dcc.Graph(
-                        id=self.id,
-                        figure=go.Figure(
-                            layout={
-                                "paper_bgcolor": "rgba(0,0,0,0)",
-                                "plot_bgcolor": "rgba(0,0,0,0)",
-                                "xaxis": {"visible": False},
-                                "yaxis": {"visible": False},
-                            }
-                        ),
-                        config={"autosizable": True, "frameMargins": 0, "responsive": True},
-                    ),
+                    dcc.Graph(id=self.id, figure=go.Figure(layout=_PLACEHOLDER_LAYOUT), config=_GRAPH_CONFIG),
                     dcc.Markdown(self.footer, className="figure-footer") if self.footer else None,
                 ],
                 className="figure-container",
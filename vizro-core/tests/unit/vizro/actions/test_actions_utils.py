@@ -1,6 +1,11 @@
 import pytest
 
-from vizro.actions._actions_utils import _create_target_arg_mapping, _update_nested_graph_properties
+from vizro.actions._actions_utils import (
+    _create_target_arg_mapping,
+    _get_targets_data_and_config,
+    _update_nested_graph_properties,
+)
+from vizro.managers import data_manager
 
 
 class TestUpdateNestedGraphProperties:
@@ -94,3 +99,23 @@ class TestCreateTargetArgMapping:
         input_strings = ["component1.argument1.extra", "component2.argument2.extra"]
         expected = {"component1": ["argument1.extra"], "component2": ["argument2.extra"]}
         assert _create_target_arg_mapping(input_strings) == expected
+
+
+class TestGetTargetsDataAndConfig:
+    @pytest.mark.usefixtures("managers_one_page_two_graphs_with_dynamic_data")
+    def test_shared_data_source_loaded_once(self, gapminder):
+        load_calls = []
+
+        def load_gapminder():
+            load_calls.append(None)
+            return gapminder
+
+        data_manager["gapminder_dynamic_first_n_last_n"] = load_gapminder
+
+        filtered_data, _ = _get_targets_data_and_config(
+            ctds_filter=[], ctds_filter_interaction=[], ctds_parameters=[], targets=["box_chart", "scatter_chart"]
+        )
+
+        assert len(load_calls) == 1
+        assert filtered_data["box_chart"].equals(filtered_data["scatter_chart"])
+        assert filtered_data["box_chart"] is not filtered_data["scatter_chart"]
@@ -207,6 +207,14 @@ class TestActionPrivateMethods:
         assert callback_outputs == expected_get_callback_mapping_outputs
         assert action_components == []
 
+    def test_get_callback_mapping_after_inputs_and_outputs_reassigned(self, identity_action_function):
+        action = Action(function=identity_action_function())
+        action.inputs = ["component.property"]
+        action.outputs = ["component.property"]
+        callback_inputs, callback_outputs, _ = action._get_callback_mapping()
+        assert callback_inputs == [State("component", "property")]
+        assert callback_outputs == Output("component", "property")
+
     @pytest.mark.parametrize("inputs", [["value"], {"arg": "value"}])
     def test_action_callback_function_inputs_args_or_kwargs(self, identity_action_function, inputs):
         action = Action(function=identity_action_function())
@@ -2,6 +2,8 @@
 
 import re
 
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 import pytest
 from asserts import assert_component_equal
@@ -15,8 +17,10 @@ except ImportError:  # pragma: no cov
 
 import vizro.models as vm
 import vizro.plotly.express as px
+from vizro.actions import filter_interaction
 from vizro.managers import data_manager
 from vizro.models._action._action import Action
+from vizro.models._components.graph import _equals_mask
 
 
 @pytest.fixture
@@ -144,6 +148,31 @@ class TestAttributesGraph:
         assert hasattr(graph, "_filter_interaction_input")
         assert "modelID" in graph._filter_interaction_input
 
+    def test_get_filter_interaction_targets(self, standard_px_chart):
+        graph = vm.Graph(
+            figure=standard_px_chart, actions=[Action(function=filter_interaction(targets=["graph_1", "graph_2"]))]
+        )
+        assert graph._get_filter_interaction_targets() == {"graph_1", "graph_2"}
+
+        # Reassigning actions must not leave the previously computed targets in place.
+        graph.actions = [Action(function=filter_interaction(targets=["graph_3"]))]
+        assert graph._get_filter_interaction_targets() == {"graph_3"}
+
+
+class TestEqualsMask:
+    @pytest.mark.parametrize(
+        "series, value, expected",
+        [
+            (pd.Series([1, 2, 1]), 1, [True, False, True]),
+            (pd.Series([1.0, 2.5, 1.0]), 1, [True, False, True]),
+            (pd.Series([1, 2, 1]), "1", [False, False, False]),
+            (pd.Series(["a", "b", "a"]), "a", [True, False, True]),
+            (pd.Series([1, None, 1], dtype="Int64"), 1, [True, False, True]),
+        ],
+    )
+    def test_equals_mask(self, series, value, expected):
+        np.testing.assert_array_equal(_equals_mask(series, value), np.array(expected))
+
 
 class TestProcessGraphDataFrame:
     def test_process_figure_data_frame_str_df(self, standard_px_chart_with_str_dataframe, gapminder):